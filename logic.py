@@ -50,6 +50,14 @@ def calculate_G_tilde(C, chi):
             G_tilde[i, j] = sum((1 - chi[i]) * C[i, s] for s in range(j, n))
     return G_tilde
 
+# Вычисление j-го столбца матрицы D за O(n) (нужен только j-й столбец C)
+def calculate_D_column(column, chi, j):
+    column = np.asarray(column, dtype=float)
+    chi = np.asarray(chi, dtype=float)
+    prefix = np.dot(1 - chi[:j], column[:j])
+    outdated = np.dot(chi, column)
+    return prefix + (1 - chi) * column + outdated
+
 # Жадная стратегия
 def greedy_strategy(D):
     n = len(D)
@@ -69,7 +77,8 @@ def greedy_strategy(D):
 # Венгерский алгоритм
 def hungarian_algorithm(G_tilde):
     row_ind, col_ind = linear_sum_assignment(-G_tilde)
-    return col_ind.tolist()
+    # col_ind[i] — период группы i; переводим в assignment[j] — группа периода j
+    return np.argsort(col_ind).tolist()
 
 # Минимальная стратегия
 def min_strategy(D):
@@ -109,6 +118,260 @@ def calculate_S3(G_tilde, assignment):
         s3 += G_tilde[assignment[j], j]
     return s3
 
+# Потоковый режим: столбцы матрицы C поступают по одному за период
+class OnlineGreedy:
+    """Онлайн-вариант жадной стратегии.
+
+    На каждом периоде j принимает столбец C[:, j], вычисляет столбец D
+    и сразу фиксирует защищаемую группу. Время решения за период — O(n)
+    и не зависит от числа уже обработанных периодов.
+    """
+    def __init__(self, chi):
+        self.chi = np.asarray(chi, dtype=float)
+        self.n = len(self.chi)
+        self.columns = []
+        self.assignment = []
+        self.used = np.zeros(self.n, dtype=bool)
+        # Веса (1 - chi_s) групп, уже получивших обновлённую защиту
+        self.protected_weight = np.zeros(self.n)
+        self.s1 = 0.0
+        self.s1_history = []
+
+    def push(self, column):
+        """Обрабатывает столбец C[:, j] и возвращает выбранную группу."""
+        j = len(self.columns)
+        if j >= self.n:
+            raise ValueError("Все периоды уже обработаны.")
+        column = np.asarray(column, dtype=float)
+        if column.shape != (self.n,):
+            raise ValueError(f"Столбец должен содержать {self.n} элементов.")
+
+        D_column = calculate_D_column(column, self.chi, j)
+        best_i = int(np.argmax(np.where(self.used, -np.inf, D_column)))
+        self.used[best_i] = True
+        self.protected_weight[best_i] += 1 - self.chi[best_i]
+
+        # Слагаемое S1 для периода j: защищённые группы + устаревшая защита
+        self.s1 += np.dot(self.protected_weight, column) + np.dot(self.chi, column)
+        self.s1_history.append(self.s1)
+        self.columns.append(column)
+        self.assignment.append(best_i)
+        return best_i
+
+    def finish(self):
+        """Сравнивает накопленную прибыль с оптимумом, найденным задним числом."""
+        if len(self.columns) != self.n:
+            raise ValueError("Не все периоды обработаны.")
+        C = np.column_stack(self.columns)
+        G_tilde = calculate_G_tilde(C, self.chi)
+        hungarian_assignment = hungarian_algorithm(G_tilde)
+        S3_hungarian = calculate_S3(G_tilde, hungarian_assignment)
+
+        # Вклад оптимального назначения в S3 по периодам: прибыль групп,
+        # защищённых к периоду j; сумма по всем периодам равна S3
+        counts = _protection_counts(hungarian_assignment, self.n)
+        hindsight = np.cumsum(np.sum((1 - self.chi)[:, None] * counts * C, axis=0))
+        return {
+            'assignment': self.assignment,
+            'S1': self.s1,
+            'S1_history': list(self.s1_history),
+            'hungarian_assignment': hungarian_assignment,
+            'S3': S3_hungarian,
+            'loss': S3_hungarian - self.s1,
+            'loss_history': (hindsight - np.array(self.s1_history)).tolist(),
+        }
+
+# Матрица кратностей: сколько раз группа i защищена в периодах 0..j
+def _protection_counts(assignment, n):
+    counts = np.zeros((n, n))
+    np.add.at(counts, (np.asarray(assignment), np.arange(n)), 1)
+    return np.cumsum(counts, axis=1)
+
+# Градиент S1 по chi и по C при фиксированном назначении
+def calculate_S1_gradient(assignment, chi, C):
+    C = np.asarray(C, dtype=float)
+    chi = np.asarray(chi, dtype=float)
+    counts = _protection_counts(assignment, len(C))
+    grad_chi = np.sum(C * (1 - counts), axis=1)
+    grad_C = (1 - chi)[:, None] * counts + chi[:, None]
+    return grad_chi, grad_C
+
+# Градиент S3 по chi и по C при фиксированном назначении
+def calculate_S3_gradient(assignment, chi, C):
+    C = np.asarray(C, dtype=float)
+    chi = np.asarray(chi, dtype=float)
+    n = len(C)
+    # Суффиксные суммы строк: sum(C[i, s] for s in range(j, n))
+    tails = np.cumsum(C[:, ::-1], axis=1)[:, ::-1]
+    chosen = np.zeros((n, n))
+    np.add.at(chosen, (np.asarray(assignment), np.arange(n)), 1)
+    grad_chi = -np.sum(chosen * tails, axis=1)
+    grad_C = (1 - chi)[:, None] * np.cumsum(chosen, axis=1)
+    return grad_chi, grad_C
+
+# Чувствительность целевых функций всех стратегий к chi и C
+def sensitivity_report(C, chi, heuristic_assignments, hungarian_assignment):
+    report = {}
+    for name, assignment in heuristic_assignments.items():
+        report[name] = calculate_S1_gradient(assignment, chi, C)
+    # hungarian_assignment[j] — группа периода j (как возвращает hungarian_algorithm);
+    # в точке оптимума градиент S3 совпадает с градиентом оптимальной прибыли
+    report['hungarian'] = calculate_S3_gradient(hungarian_assignment, chi, C)
+    return report
+
+# Один шаг венгерского алгоритма: увеличивающий путь из свободной строки, O(n^2)
+def _augment(cost, u, v, row_of_col, start_row):
+    n = cost.shape[1]
+    minv = np.full(n, np.inf)
+    way = np.full(n, -1)
+    used = np.zeros(n, dtype=bool)
+    j0 = -1
+    while True:
+        i0 = start_row if j0 == -1 else row_of_col[j0]
+        reduced = cost[i0] - u[i0] - v
+        better = ~used & (reduced < minv)
+        minv[better] = reduced[better]
+        way[better] = j0
+        j1 = int(np.argmin(np.where(used, np.inf, minv)))
+        delta = minv[j1]
+        u[start_row] += delta
+        u[row_of_col[used]] += delta
+        v[used] -= delta
+        minv[~used] -= delta
+        used[j1] = True
+        j0 = j1
+        if row_of_col[j0] == -1:
+            break
+    # Перекладываем назначения вдоль найденного пути
+    while True:
+        j1 = way[j0]
+        if j1 == -1:
+            row_of_col[j0] = start_row
+            break
+        row_of_col[j0] = row_of_col[j1]
+        j0 = j1
+
+# Задача с изменяемым набором групп активов
+class AssignmentInstance:
+    """Хранит C, chi, G_tilde и оптимальное назначение с потенциалами.
+
+    Число периодов всегда равно числу групп: новая группа добавляет
+    последний период, выбывающая группа убирает последний период.
+    Поэтому G_tilde остальных строк сдвигается на константу по строке,
+    что учитывается потенциалами, и оптимум восстанавливается одним
+    увеличивающим путём за O(n^2).
+    """
+    def __init__(self, C, chi):
+        self.C = np.array(C, dtype=float)
+        self.chi = np.array(chi, dtype=float)
+        self.G_tilde = calculate_G_tilde(self.C, self.chi)
+        n = len(self.C)
+        # Минимизируем -G_tilde; u, v — потенциалы строк и столбцов
+        self.u = np.zeros(n)
+        self.v = np.zeros(n)
+        self.row_of_col = np.full(n, -1)
+        for i in range(n):
+            _augment(-self.G_tilde, self.u, self.v, self.row_of_col, i)
+
+    @property
+    def n(self):
+        return len(self.C)
+
+    @property
+    def assignment(self):
+        # assignment[j] — группа, защищаемая в период j, как в hungarian_algorithm
+        return self.row_of_col.tolist()
+
+    def add_group(self, row, column, chi_new):
+        """Добавляет группу и новый последний период.
+
+        row — прибыль новой группы за все n + 1 периодов,
+        column — прибыль существующих n групп за новый период.
+        """
+        n = self.n
+        row = np.asarray(row, dtype=float)
+        column = np.asarray(column, dtype=float)
+        if row.shape != (n + 1,):
+            raise ValueError(f"Строка должна содержать {n + 1} элементов.")
+        if column.shape != (n,):
+            raise ValueError(f"Столбец должен содержать {n} элементов.")
+        if not 0 <= chi_new <= 1:
+            raise ValueError("Коэффициент chi должен быть в диапазоне от 0 до 1.")
+
+        # Новый период увеличивает G_tilde каждой строки на константу
+        shift = (1 - self.chi) * column
+        G_tilde = np.empty((n + 1, n + 1))
+        G_tilde[:n, :n] = self.G_tilde + shift[:, None]
+        G_tilde[:n, n] = shift
+        G_tilde[n] = (1 - chi_new) * np.cumsum(row[::-1])[::-1]
+        self.u -= shift
+
+        C = np.empty((n + 1, n + 1))
+        C[:n, :n] = self.C
+        C[:n, n] = column
+        C[n] = row
+        self.C = C
+        self.chi = np.append(self.chi, chi_new)
+        self.G_tilde = G_tilde
+
+        # Потенциал нового столбца сохраняет допустимость двойственного решения
+        self.v = np.append(self.v, np.min(-G_tilde[:n, n] - self.u))
+        self.u = np.append(self.u, 0.0)
+        self.row_of_col = np.append(self.row_of_col, -1)
+        _augment(-self.G_tilde, self.u, self.v, self.row_of_col, n)
+        return self.report()
+
+    def remove_group(self, k):
+        """Удаляет группу k и последний период."""
+        n = self.n
+        if not 0 <= k < n:
+            raise ValueError(f"Номер группы должен быть от 0 до {n - 1}.")
+        if n == 1:
+            raise ValueError("Нельзя удалить единственную группу.")
+
+        col_k = int(np.flatnonzero(self.row_of_col == k)[0])
+        row_last = self.row_of_col[n - 1]
+
+        # Без последнего периода G_tilde каждой строки уменьшается на константу
+        shift = (1 - self.chi) * self.C[:, n - 1]
+        keep = np.arange(n) != k
+        self.G_tilde = (self.G_tilde - shift[:, None])[keep, :n - 1]
+        self.u = (self.u + shift)[keep]
+        self.C = self.C[keep, :n - 1]
+        self.chi = self.chi[keep]
+        self.v = self.v[:n - 1]
+        row_of_col = self.row_of_col[:n - 1]
+        row_of_col[row_of_col > k] -= 1
+        self.row_of_col = row_of_col
+
+        if col_k != n - 1:
+            # Столбец группы k освободился, строка последнего периода — тоже
+            self.row_of_col[col_k] = -1
+            start_row = row_last - 1 if row_last > k else row_last
+            _augment(-self.G_tilde, self.u, self.v, self.row_of_col, start_row)
+        return self.report()
+
+    def report(self):
+        """Оптимум S3 и потери эвристических стратегий."""
+        D = np.column_stack([calculate_D_column(self.C[:, j], self.chi, j)
+                             for j in range(self.n)])
+        hungarian_assignment = self.assignment
+        S3_hungarian = calculate_S3(self.G_tilde, hungarian_assignment)
+        strategies = {
+            'greedy': greedy_strategy(D),
+            'min': min_strategy(D),
+            'max': max_strategy(D),
+            'random': random_strategy(D),
+        }
+        losses = {name: S3_hungarian - calculate_S1(D, assignment, self.chi, self.C)
+                  for name, assignment in strategies.items()}
+        return {
+            'hungarian_assignment': hungarian_assignment,
+            'S3': S3_hungarian,
+            'assignments': strategies,
+            'losses': losses,
+        }
+
 # Основная функция для анализа
 def analyze(n, mode='random', row_mode='random', col_mode='random'):
     # Генерация данных
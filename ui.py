@@ -33,12 +33,28 @@ def _format_vector(vector):
     html += "</table>"
     return html
 
+def _format_sensitivity(report, names):
+    """Форматирует производные по chi для всех стратегий в виде HTML-таблицы."""
+    n = len(next(iter(report.values()))[0])
+    html = "<table border='1' cellpadding='5' cellspacing='0' style='border-collapse: collapse;'>"
+    html += "<tr><th>Группа</th>"
+    for key in report:
+        html += f"<th>{names[key]}</th>"
+    html += "</tr>"
+    for i in range(n):
+        html += f"<tr><td style='text-align: center;'>{i}</td>"
+        for grad_chi, _ in report.values():
+            html += f"<td style='text-align: center;'>{grad_chi[i]:.2f}</td>"
+        html += "</tr>"
+    html += "</table>"
+    return html
+
 class MatrixWindow(QWidget):
     """Окно для отображения матриц и векторов."""
-    def __init__(self, matrices_text, dark_theme=True):
+    def __init__(self, matrices_text, dark_theme=True, title="Матрицы и векторы"):
         super().__init__()
         self.dark_theme = dark_theme
-        self.setWindowTitle("Матрицы и векторы")
+        self.setWindowTitle(title)
         self.setGeometry(200, 200, 800, 800)
 
         # Текстовое поле для вывода матриц
@@ -106,6 +122,8 @@ class MainWindow(QMainWindow):
 
         # Переменная для хранения текста с матрицами
         self.matrices_text = ""
+        # Переменная для хранения отчёта о чувствительности
+        self.sensitivity_text = ""
 
         self.initUI()
 
@@ -196,6 +214,12 @@ class MainWindow(QMainWindow):
         self.plot_button.clicked.connect(self.plot_losses)
         main_layout.addWidget(self.plot_button)
 
+        # Кнопка для отчёта о чувствительности
+        self.sensitivity_button = QPushButton("Показать чувствительность")
+        self.sensitivity_button.setFont(QFont("Segoe UI", 12))
+        self.sensitivity_button.clicked.connect(self.show_sensitivity)
+        main_layout.addWidget(self.sensitivity_button)
+
         # Текстовое поле для вывода результатов
         self.text_output = QTextEdit()
         self.text_output.setFont(QFont("Segoe UI", 12))
@@ -255,6 +279,13 @@ class MainWindow(QMainWindow):
                 padding: 10px; 
                 border-radius: 10px;
             """)
+            self.sensitivity_button.setStyleSheet("""
+                background-color: #A393EB; 
+                color: #FFFFFF; 
+                border: none; 
+                padding: 10px; 
+                border-radius: 10px;
+            """)
         else:
             # Светлая тема
             self.setStyleSheet("""
@@ -297,6 +328,13 @@ class MainWindow(QMainWindow):
                 padding: 10px; 
                 border-radius: 10px;
             """)
+            self.sensitivity_button.setStyleSheet("""
+                background-color: #d6e6f2; 
+                color: #000000; 
+                border: none; 
+                padding: 10px; 
+                border-radius: 10px;
+            """)
 
     def run_analysis(self):
         """Запуск анализа."""
@@ -442,6 +480,31 @@ class MainWindow(QMainWindow):
                 _format_matrix(G_tilde)  # Форматируем матрицу G_tilde
             )
 
+            # Производные целевых функций по chi и C при найденных назначениях
+            report = sensitivity_report(C, chi, {
+                'greedy': greedy_assignment,
+                'min': min_assignment,
+                'max': max_assignment,
+                'random': random_assignment,
+            }, hungarian_assignment)
+            names = {
+                'greedy': "Жадная",
+                'min': "Минимальная",
+                'max': "Максимальная",
+                'random': "Случайная",
+                'hungarian': "Венгерский алгоритм",
+            }
+            self.sensitivity_text = """
+            <h2 style="color: #BBA9FF;">Производные по χ<sub>i</sub>:</h2>
+            <p style="color: #BBA9FF;">Для эвристических стратегий — производные S1, для венгерского алгоритма — производные S3.</p>
+            {}
+            """.format(_format_sensitivity(report, names))
+            for key, (_, grad_C) in report.items():
+                self.sensitivity_text += """
+            <h2 style="color: #BBA9FF;">Производные по C ({}):</h2>
+            {}
+            """.format(names[key], _format_matrix(grad_C))
+
         except Exception as e:
             # Вывод сообщения об ошибке
             QMessageBox.critical(self, "Ошибка", str(e))
@@ -456,6 +519,15 @@ class MainWindow(QMainWindow):
         self.matrix_window = MatrixWindow(self.matrices_text, self.dark_theme)
         self.matrix_window.show()
 
+    def show_sensitivity(self):
+        """Открывает окно с отчётом о чувствительности."""
+        if not self.sensitivity_text:
+            QMessageBox.warning(self, "Предупреждение", "Сначала запустите анализ.")
+            return
+
+        self.sensitivity_window = MatrixWindow(self.sensitivity_text, self.dark_theme, "Чувствительность")
+        self.sensitivity_window.show()
+
     def plot_losses(self):
         """Строит график потерь для всех стратегий."""
         try: